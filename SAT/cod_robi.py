@@ -4,14 +4,70 @@ from itertools import combinations
 
 # --- SAT Solvers ---
 
+def canonical_clause(clause):
+    """Deduplicate and sort a clause by variable (negative literal first)."""
+    return tuple(sorted(set(clause), key=lambda lit: (abs(lit), lit)))
+
 def resolve(clause1, clause2):
-    for literal in clause1:
-        if -literal in clause2:
-            new_clause = set(clause1) | set(clause2)
-            new_clause.discard(literal)
-            new_clause.discard(-literal)
-            return list(new_clause)
-    return None
+    """
+    Resolve two canonical clause tuples on their first complementary
+    variable using a two-pointer merge: no intermediate sets are built,
+    duplicates collapse during the merge, and both pivot literals are
+    skipped.  Variables that are tautological in a parent are not used as
+    pivots (such resolvents are subsumed by the other parent anyway).
+    Returns the resolvent tuple, or None if the clauses do not clash.
+    """
+    n1, n2 = len(clause1), len(clause2)
+    pivot = 0
+    i = j = 0
+    while i < n1 and j < n2:
+        a, b = clause1[i], clause2[j]
+        va, vb = abs(a), abs(b)
+        if va < vb:
+            i += 1
+        elif vb < va:
+            j += 1
+        else:
+            # In canonical order both polarities of a variable sit next to
+            # each other, so a parent is tautological in this variable
+            # exactly when the following literal has the same variable.
+            taut1 = i + 1 < n1 and abs(clause1[i + 1]) == va
+            taut2 = j + 1 < n2 and abs(clause2[j + 1]) == va
+            if a == -b and not taut1 and not taut2:
+                pivot = va
+                break
+            # Same polarity, or a tautological parent: skip this variable.
+            while i < n1 and abs(clause1[i]) == va:
+                i += 1
+            while j < n2 and abs(clause2[j]) == va:
+                j += 1
+    if pivot == 0:
+        return None
+
+    resolvent = []
+    i = j = 0
+    while i < n1 or j < n2:
+        if i < n1 and j < n2:
+            a, b = clause1[i], clause2[j]
+            if a == b:
+                lit = a
+                i += 1
+                j += 1
+            elif (abs(a), a) < (abs(b), b):
+                lit = a
+                i += 1
+            else:
+                lit = b
+                j += 1
+        elif i < n1:
+            lit = clause1[i]
+            i += 1
+        else:
+            lit = clause2[j]
+            j += 1
+        if abs(lit) != pivot:
+            resolvent.append(lit)
+    return tuple(resolvent)
 
 def resolution_algorithm(clauses, max_iterations=3, max_clauses=5000):
     """
@@ -21,11 +77,15 @@ def resolution_algorithm(clauses, max_iterations=3, max_clauses=5000):
       - True if resolution completes with no new clauses (suggesting SAT),
       - None if it hits an iteration or clause count limit.
     """
-    new_clauses = set(map(tuple, clauses))
+    new_clauses = set(map(canonical_clause, clauses))
+    # Clauses are only ever added, so a pair's resolvent can never change
+    # across iterations; remembering handled pairs turns every re-listed
+    # combination from a resolve() call into a dict lookup.
+    pair_cache = {}
     iteration = 0
     while iteration < max_iterations:
         iteration += 1
-        
+
         # If too many clauses are generated, bail out.
         if len(new_clauses) > max_clauses:
             print(f"Resolution: Too many clauses ({len(new_clauses)}) at iteration {iteration}. Aborting resolution.")
@@ -34,11 +94,22 @@ def resolution_algorithm(clauses, max_iterations=3, max_clauses=5000):
         new_pairs = list(combinations(new_clauses, 2))
         generated = set()
         for clause1, clause2 in new_pairs:
-            resolvent = resolve(list(clause1), list(clause2))
+            # Set iteration order is not stable as the set grows, so key the
+            # cache on the sorted pair.
+            key = (clause1, clause2) if clause1 <= clause2 else (clause2, clause1)
+            if key in pair_cache:
+                continue  # resolvent already in the database (or none/tautological)
+            resolvent = resolve(clause1, clause2)
+            pair_cache[key] = resolvent
             if resolvent is not None:
                 if not resolvent:  # Empty clause found: unsat
                     return False
-                generated.add(tuple(sorted(resolvent)))
+                # Tautological resolvents (v and -v sit next to each other
+                # in canonical order) can never help a refutation.
+                if any(resolvent[k] == -resolvent[k + 1]
+                       for k in range(len(resolvent) - 1)):
+                    continue
+                generated.add(resolvent)
         # If no new resolvents were generated, return SAT.
         if not generated.difference(new_clauses):
             return True
@@ -1,9 +1,32 @@
+import os
+import re
 import time
-import sys
-from concurrent.futures import ProcessPoolExecutor, as_completed
-
-# Increase recursion limit for deep recursions in DP and DPLL
-sys.setrecursionlimit(10000)
+import threading
+from array import array
+from collections import defaultdict
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed, wait, FIRST_COMPLETED)
+
+# Numba is optional: when it is installed the propagation kernel below is
+# JIT-compiled to native code; without it the kernel still runs as plain
+# Python over the same flat arrays.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorate(func):
+            return func
+        return decorate
+
+# Optional compiled watched-literal core (build: cythonize -i dpll_core.pyx).
+# When the extension is importable, dpll_wrapper hands the search to it.
+try:
+    import dpll_core
+except ImportError:
+    dpll_core = None
+
+class SearchCancelled(Exception):
+    """Raised inside an algorithm when its cancellation event is set."""
 
 
 # ---------------------------
@@ -14,19 +37,20 @@ def parse_input_file_generator(filename):
     Generator version: yields one set of clauses at a time.
     Each set is a list of clauses; each clause is a list of integers.
     Clauses are provided on separate lines, and an empty line signals a new set.
+    The whole file is read with a single call and split into blank-line
+    separated blocks, so the hot path is one comprehension per formula
+    instead of per-line generator bookkeeping.
     """
-    current_set = []
     with open(filename, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line == "":
-                if current_set:
-                    yield current_set
-                    current_set = []
-            else:
-                # Each clause is represented by space-separated integers
-                clause = list(map(int, line.split()))
-                current_set.append(clause)
+        data = f.read()
+    # Normalize Windows line endings so the blank-line split stays exact.
+    if "\r" in data:
+        data = data.replace("\r\n", "\n").replace("\r", "\n")
+    # A separator is any blank line, including whitespace-only ones.
+    for block in re.split(r"\n\s*\n", data):
+        # Each clause is represented by space-separated integers
+        current_set = [list(map(int, line.split()))
+                       for line in block.split("\n") if line and not line.isspace()]
         if current_set:
             yield current_set
 
@@ -39,14 +63,21 @@ def write_output_file(filename, results):
     Writes the results into an output file.
     'results' is a list where each element is a dictionary mapping algorithm names
     to a tuple (result boolean, execution time).
+    The whole report is assembled in memory and flushed with one write call
+    instead of issuing a write per line.
     """
-    with open(filename, "w") as f:
-        for i, res in enumerate(results):
-            f.write(f"Set {i+1}:\n")
-            for alg_name, (result, duration) in res.items():
+    parts = []
+    for i, res in enumerate(results):
+        parts.append(f"Set {i+1}:\n")
+        for alg_name, (result, duration) in res.items():
+            if result is None:
+                res_text = "Cancelled"
+            else:
                 res_text = "Satisfiable" if result else "Unsatisfiable"
-                f.write(f"  {alg_name}: {res_text}, {duration:.6f} sec\n")
-            f.write("\n")
+            parts.append(f"  {alg_name}: {res_text}, {duration:.6f} sec\n")
+        parts.append("\n")
+    with open(filename, "w") as f:
+        f.write("".join(parts))
 
 
 # ---------------------------
@@ -54,77 +85,214 @@ def write_output_file(filename, results):
 # ---------------------------
 
 # --- Resolution Algorithm ---
+def encode_clause(clause):
+    """
+    Encode a clause as a pair (pos_mask, neg_mask) of integer bitmasks.
+    Bit v-1 of pos_mask is set when variable v occurs positively, and
+    bit v-1 of neg_mask when it occurs negatively.  Python integers are
+    arbitrary precision, so the encoding works for any variable range;
+    all clause operations below become a handful of native integer ops
+    instead of per-literal set operations.
+    """
+    pos = 0
+    neg = 0
+    for lit in clause:
+        if lit > 0:
+            pos |= 1 << (lit - 1)
+        else:
+            neg |= 1 << (-lit - 1)
+    return pos, neg
+
 def resolve_pair(ci, cj):
     """
-    For two clauses (as frozensets), try to resolve on any pair of complementary literals.
-    Return a set of possible resolvents.
+    For two encoded clauses, resolve on every pair of complementary literals.
+    Tautological resolvents (containing some v and -v) are discarded.
+    Return a set of possible (encoded) resolvents.
     """
+    pos_i, neg_i = ci
+    pos_j, neg_j = cj
+    pos_all = pos_i | pos_j
+    neg_all = neg_i | neg_j
     resolvents = set()
-    for literal in ci:
-        if -literal in cj:
-            resolvent = (ci - {literal}) | (cj - {-literal})
-            resolvents.add(frozenset(resolvent))
+    common = (pos_i & neg_j) | (neg_i & pos_j)
+    while common:
+        bit = common & -common  # isolate lowest complementary variable
+        common ^= bit
+        pos = pos_all & ~bit
+        neg = neg_all & ~bit
+        if pos & neg:  # tautology: another variable occurs in both polarities
+            continue
+        resolvents.add((pos, neg))
     return resolvents
 
-def resolution(clauses):
+def resolution(clauses, cancel=None):
     """
-    Resolution algorithm:
-      - Clauses are converted into frozensets to ensure immutability and easy duplicate checks.
-      - Iteratively applies the resolution rule until either:
+    Resolution algorithm using the given-clause loop of classical
+    resolution provers:
+      - 'unprocessed' holds clauses not yet resolved against anything;
+        'processed' holds clauses whose pairings are already exhausted.
+      - Each round pops one clause and resolves it only against the
+        processed set, so every clause pair is considered exactly once
+        instead of being re-resolved on every saturation round.
+      - Terminates when either:
           • the empty clause is derived (unsatisfiable), or
-          • no new clauses can be added.
+          • unprocessed runs empty (saturation, no refutation).
     Returns:
       - False if unsatisfiability is proven (empty clause derived).
       - True if no refutation is found.
+    Raises SearchCancelled when the optional 'cancel' event is set.
     """
-    clauses_set = set(frozenset(clause) for clause in clauses)
-    new = set()
-    while True:
-        # Evaluate all distinct clause pairs
-        pairs = [(ci, cj) for ci in clauses_set for cj in clauses_set if ci != cj]
-        for (ci, cj) in pairs:
+    # Tautological input clauses (v and -v together) are redundant for
+    # refutation and would confuse the bitmask resolvent construction.
+    unprocessed = {c for c in map(encode_clause, clauses) if not c[0] & c[1]}
+    empty = (0, 0)
+    if empty in unprocessed:
+        return False
+    processed = set()
+    while unprocessed:
+        if cancel is not None and cancel.is_set():
+            raise SearchCancelled
+        ci = unprocessed.pop()
+        for cj in processed:
             resolvents = resolve_pair(ci, cj)
-            if frozenset() in resolvents:  # derived empty clause
+            if empty in resolvents:  # derived empty clause
                 return False
-            new = new.union(resolvents)
-        if new.issubset(clauses_set):
-            return True  # no new clause can be added
-        clauses_set.update(new)
+            # Only genuinely new clauses feed further rounds.
+            unprocessed.update(resolvents - processed)
+        processed.add(ci)
+    return True  # saturated: no new clause can be added
 
 
 # --- Davis-Putnam (DP) Algorithm ---
-def dp(clauses):
+def dp(clauses, cancel=None):
     """
-    Simple Davis-Putnam recursive algorithm.
-    Base cases:
-      - If an empty clause is found: unsatisfiable.
-      - If there are no clauses left: satisfiable.
-    Then, a variable is selected and eliminated using resolution-like steps.
+    Simple Davis-Putnam algorithm.
+    Clauses are bitmask-encoded up front (see encode_clause); the
+    elimination loop works entirely on (pos_mask, neg_mask) pairs.
+    Tautological clauses are dropped immediately since they can never
+    participate in a refutation.
     """
-    if any(len(clause) == 0 for clause in clauses):
-        return False
-    if not clauses:
-        return True
+    return _dp([c for c in map(encode_clause, clauses) if not c[0] & c[1]],
+               cancel=cancel)
 
-    vars_set = {abs(lit) for clause in clauses for lit in clause}
-    if not vars_set:
-        return True
-
-    p = next(iter(vars_set))
-    pos_clauses = [clause for clause in clauses if p in clause]
-    neg_clauses = [clause for clause in clauses if -p in clause]
-    new_clauses = [clause for clause in clauses if p not in clause and -p not in clause]
-
-    resolvents = []
-    for ci in pos_clauses:
-        for cj in neg_clauses:
-            resolvent = (set(ci) - {p}) | (set(cj) - {-p})
-            # Skip tautologies
-            if any(x in resolvent and -x in resolvent for x in resolvent):
-                continue
-            resolvents.append(list(resolvent))
-    new_clauses.extend(resolvents)
-    return dp(new_clauses)
+def _dp(clauses, cancel=None):
+    """
+    Iterative core of DP over encoded clauses.  Each pass of the loop
+    either finishes (empty clause found: unsatisfiable; no clauses left:
+    satisfiable), drops the clauses satisfied by pure variables, or
+    eliminates one variable with resolution-like steps.  An explicit loop
+    replaces the old tail recursion, so elimination depth is no longer
+    bounded by the interpreter's recursion limit.
+    """
+    while True:
+        if cancel is not None and cancel.is_set():
+            raise SearchCancelled
+        if any(clause == (0, 0) for clause in clauses):
+            return False
+        if not clauses:
+            return True
+
+        # Index clauses by occurring variable (one bit per variable), built
+        # once per elimination step, so the pos/neg/untouched split costs
+        # O(#occurrences) instead of a full scan per polarity.
+        occ_pos = defaultdict(set)
+        occ_neg = defaultdict(set)
+        for idx, (pos, neg) in enumerate(clauses):
+            while pos:
+                b = pos & -pos
+                pos ^= b
+                occ_pos[b].add(idx)
+            while neg:
+                b = neg & -neg
+                neg ^= b
+                occ_neg[b].add(idx)
+        if not occ_pos and not occ_neg:
+            return True
+
+        # Variables occurring in a single polarity are pure: every clause
+        # containing one can be satisfied outright and dropped, with no
+        # resolvents at all.
+        pure_idx = set()
+        for b in occ_pos.keys() - occ_neg.keys():
+            pure_idx |= occ_pos[b]
+        for b in occ_neg.keys() - occ_pos.keys():
+            pure_idx |= occ_neg[b]
+        if pure_idx:
+            clauses = [clause for idx, clause in enumerate(clauses)
+                       if idx not in pure_idx]
+            continue
+
+        # Eliminate the variable producing the fewest resolvents: clause
+        # growth per elimination step is |pos|*|neg|, so always take the
+        # cheapest one.
+        bit = min(occ_pos, key=lambda b: len(occ_pos[b]) * len(occ_neg[b]))
+        pos_idx = occ_pos[bit]
+        neg_idx = occ_neg[bit]
+        touched = pos_idx | neg_idx
+        new_clauses = [clause for idx, clause in enumerate(clauses)
+                       if idx not in touched]
+
+        keep = ~bit
+        seen = set(new_clauses)
+
+        # Inverted index (signed variable bit -> clause positions) over the
+        # kept clauses for forward subsumption.  A subsuming clause shares
+        # every one of its literals with the candidate, so only clauses
+        # occurring on one of the candidate's literals ever need the subset
+        # test.
+        sub_index = defaultdict(list)
+
+        def index_clause(k, pos, neg):
+            while pos:
+                b = pos & -pos
+                pos ^= b
+                sub_index[b].append(k)
+            while neg:
+                b = neg & -neg
+                neg ^= b
+                sub_index[-b].append(k)
+
+        def subsumed(pos, neg):
+            candidates = set()
+            m = pos
+            while m:
+                b = m & -m
+                m ^= b
+                candidates.update(sub_index[b])
+            m = neg
+            while m:
+                b = m & -m
+                m ^= b
+                candidates.update(sub_index[-b])
+            for k in candidates:
+                cp, cn = new_clauses[k]
+                if (cp & pos) == cp and (cn & neg) == cn:
+                    return True  # existing clause is a subset: drop the candidate
+            return False
+
+        for k, (cp, cn) in enumerate(new_clauses):
+            index_clause(k, cp, cn)
+
+        for i in pos_idx:
+            # Elimination steps can blow up quadratically, so honor a pending
+            # cancellation inside the step as well, not just between steps.
+            if cancel is not None and cancel.is_set():
+                raise SearchCancelled
+            pi, ni = clauses[i]
+            for j in neg_idx:
+                pj, nj = clauses[j]
+                pos = (pi | pj) & keep
+                neg = (ni | nj) & keep
+                # Skip tautologies
+                if pos & neg:
+                    continue
+                resolvent = (pos, neg)
+                if resolvent in seen or subsumed(pos, neg):
+                    continue
+                seen.add(resolvent)
+                new_clauses.append(resolvent)
+                index_clause(len(new_clauses) - 1, pos, neg)
+        clauses = new_clauses
 
 
 # --- DPLL Algorithm ---
@@ -140,9 +308,9 @@ def simplify_clauses(clauses, assignment):
         new_clause = set()
         satisfied = False
         for lit in clause:
-            var = abs(lit)
+            var = lit if lit > 0 else -lit
             if var in assignment:
-                if (lit > 0 and assignment[var]) or (lit < 0 and not assignment[var]):
+                if assignment[var] == (lit > 0):
                     satisfied = True
                     break
             else:
@@ -151,88 +319,379 @@ def simplify_clauses(clauses, assignment):
             new_clauses.append(new_clause)
     return new_clauses
 
-def dpll(clauses, assignment):
+def build_occurrence_index(clauses):
+    """
+    Map each literal to the set of indices of the clauses containing it.
+    """
+    occ = defaultdict(set)
+    for idx, clause in enumerate(clauses):
+        for lit in clause:
+            occ[lit].add(idx)
+    return occ
+
+def dpll(clauses, assignment, cancel=None):
     """
-    Recursively implements the DPLL algorithm:
-      - Uses unit propagation and pure literal elimination.
-      - Makes a decision on a literal's truth value when needed.
+    Iterative trail-based DPLL:
+      - A single assignment dict is mutated in place; an explicit trail of
+        (literal, was_decision) entries replaces the per-decision dict copy
+        of the old recursive version, and backtracking pops the trail
+        instead of rebuilding state.
+      - Per-clause true/false literal counters, driven by the occurrence
+        index, replace re-simplifying the clause list: each (un)assignment
+        only touches the clauses containing the affected variable.
     Returns True if the formula is satisfiable, otherwise False.
     """
-    clauses = simplify_clauses(clauses, assignment)
-    if any(len(clause) == 0 for clause in clauses):
-        return False
+    clauses = [tuple(set(clause)) for clause in clauses]
     if not clauses:
         return True
+    if any(len(clause) == 0 for clause in clauses):
+        return False
 
-    unit_clauses = [clause for clause in clauses if len(clause) == 1]
-    if unit_clauses:
-        for clause in unit_clauses:
-            lit = next(iter(clause))
-            assignment[abs(lit)] = (lit > 0)
-        return dpll(clauses, assignment)
-
-    # Check for pure literal elimination.
-    all_lits = {lit for clause in clauses for lit in clause}
-    for lit in list(all_lits):
-        if -lit not in all_lits:
-            assignment[abs(lit)] = (lit > 0)
-            return dpll(clauses, assignment)
-
-    # Choose the next literal from the first clause that has not been assigned.
+    occ = build_occurrence_index(clauses)
+    num_clauses = len(clauses)
+    sizes = [len(clause) for clause in clauses]
+    # (literal, variable) pairs precomputed per clause: the inner loops
+    # below then cost one dict lookup per literal, with no abs() dispatch.
+    lit_vars = [tuple((lit, lit if lit > 0 else -lit) for lit in clause)
+                for clause in clauses]
+    true_count = [0] * num_clauses   # satisfied literals per clause
+    false_count = [0] * num_clauses  # falsified literals per clause
+    num_satisfied = 0
+    trail = []  # (literal, was_decision) in assignment order
+    pending = [clause[0] for clause in clauses if len(clause) == 1]
+
+    # Per-variable occurrence counts over the *unsatisfied* clauses, kept up
+    # to date on clause satisfy/unsatisfy events, so pure literals are found
+    # in O(vars) instead of rebuilding a literal set per node.
+    pos_active = defaultdict(int)
+    neg_active = defaultdict(int)
     for clause in clauses:
         for lit in clause:
-            if abs(lit) not in assignment:
-                # Try a truth assignment for the chosen literal.
-                assignment_copy = assignment.copy()
-                assignment_copy[abs(lit)] = (lit > 0)
-                if dpll(clauses, assignment_copy):
-                    assignment.update(assignment_copy)
-                    return True
-                # Try the opposite assignment.
-                assignment_copy = assignment.copy()
-                assignment_copy[abs(lit)] = not (lit > 0)
-                if dpll(clauses, assignment_copy):
-                    assignment.update(assignment_copy)
-                    return True
+            if lit > 0:
+                pos_active[lit] += 1
+            else:
+                neg_active[-lit] += 1
+    variables = sorted(pos_active.keys() | neg_active.keys())
+
+    def assign(lit, was_decision):
+        """Make lit true and update the counters; False means a clause was falsified."""
+        nonlocal num_satisfied
+        assignment[lit if lit > 0 else -lit] = (lit > 0)
+        trail.append((lit, was_decision))
+        for idx in occ[lit]:
+            if true_count[idx] == 0:
+                num_satisfied += 1
+                for l in clauses[idx]:
+                    if l > 0:
+                        pos_active[l] -= 1
+                    else:
+                        neg_active[-l] -= 1
+            true_count[idx] += 1
+        ok = True
+        for idx in occ[-lit]:
+            false_count[idx] += 1
+            if true_count[idx]:
+                continue
+            if false_count[idx] == sizes[idx]:
+                ok = False  # keep counting so the undo stays symmetric
+            elif false_count[idx] == sizes[idx] - 1:
+                # Clause became unit: queue its single unassigned literal.
+                for l, v in lit_vars[idx]:
+                    if v not in assignment:
+                        pending.append(l)
+                        break
+        return ok
+
+    def unassign(lit):
+        nonlocal num_satisfied
+        del assignment[lit if lit > 0 else -lit]
+        for idx in occ[lit]:
+            true_count[idx] -= 1
+            if true_count[idx] == 0:
+                num_satisfied -= 1
+                for l in clauses[idx]:
+                    if l > 0:
+                        pos_active[l] += 1
+                    else:
+                        neg_active[-l] += 1
+        for idx in occ[-lit]:
+            false_count[idx] -= 1
+
+    while True:
+        if cancel is not None and cancel.is_set():
+            raise SearchCancelled
+        conflict = False
+
+        # Unit propagation to fixpoint.
+        while pending:
+            lit = pending.pop()
+            var = lit if lit > 0 else -lit
+            if var in assignment:
+                if assignment[var] != (lit > 0):
+                    conflict = True
+                    break
+                continue
+            if not assign(lit, False):
+                conflict = True
+                break
+
+        if not conflict:
+            if num_satisfied == num_clauses:
+                return True
+            # Pure literal elimination: a variable whose remaining
+            # occurrences are all one polarity can be fixed without
+            # branching, straight from the maintained counts.
+            pure = None
+            for var in variables:
+                if var in assignment:
+                    continue
+                if pos_active[var]:
+                    if not neg_active[var]:
+                        pure = var
+                        break
+                elif neg_active[var]:
+                    pure = -var
+                    break
+            if pure is not None:
+                pending.append(pure)
+                continue
+            # Decision: first unassigned literal of the first unsatisfied
+            # clause (an unsatisfied clause always has one, otherwise the
+            # conflict would have been caught during assign).
+            decision = None
+            for idx in range(num_clauses):
+                if true_count[idx] == 0:
+                    for lit, var in lit_vars[idx]:
+                        if var not in assignment:
+                            decision = lit
+                            break
+                    break
+            if decision is None or not assign(decision, True):
+                conflict = True
+
+        if conflict:
+            # Backtrack: undo propagated literals, then flip the most
+            # recent decision (re-queued as a forced literal so it is not
+            # flipped a second time).
+            pending.clear()
+            while trail and not trail[-1][1]:
+                unassign(trail.pop()[0])
+            if not trail:
                 return False
-    return False
+            lit, _ = trail.pop()
+            unassign(lit)
+            pending.append(-lit)
 
-def dpll_wrapper(clauses):
+def flatten_clauses(clauses):
+    """
+    Flatten clauses into a structure-of-arrays pair (lits, starts):
+    'lits' holds every literal back to back and lits[starts[c]:starts[c+1]]
+    is clause c.  This is the layout the propagation kernel runs on.
+    """
+    lits = array("i")
+    starts = array("i", [0])
+    for clause in clauses:
+        lits.extend(clause)
+        starts.append(len(lits))
+    return lits, starts
+
+@njit(cache=True)
+def propagate(lits, starts, values):
+    """
+    Unit propagation to fixpoint over flat clause arrays.
+    'values' maps variable -> {-1, 0, 1} (false/unassigned/true) and is
+    updated in place.  Pure integer arithmetic only, so the loop compiles
+    cleanly under Numba when it is installed.
+    Returns 0 on conflict, 1 when every clause is satisfied, 2 otherwise.
+    """
+    num_clauses = len(starts) - 1
+    changed = True
+    while changed:
+        changed = False
+        all_satisfied = True
+        for c in range(num_clauses):
+            satisfied = False
+            unassigned = 0
+            last_free = 0
+            for k in range(starts[c], starts[c + 1]):
+                lit = lits[k]
+                var = lit if lit > 0 else -lit
+                val = values[var]
+                if val == 0:
+                    unassigned += 1
+                    last_free = lit
+                elif (val == 1) == (lit > 0):
+                    satisfied = True
+                    break
+            if satisfied:
+                continue
+            if unassigned == 0:
+                return 0  # every literal false: conflict
+            all_satisfied = False
+            if unassigned == 1:
+                # Unit clause: force its remaining literal.
+                if last_free > 0:
+                    values[last_free] = 1
+                else:
+                    values[-last_free] = -1
+                changed = True
+        if all_satisfied:
+            return 1
+    return 2
+
+def dpll_wrapper(clauses, cancel=None):
     """
     Wrapper for the DPLL algorithm:
       - Converts clause lists into sets.
+      - Runs the flat-array propagation kernel first, so the cheap unit
+        cascade happens before the trail engine builds its indexes.
+      - Hands the remaining search to the compiled dpll_core extension
+        when it is available, and to the pure-Python trail engine
+        otherwise.
       - Returns a tuple (result, assignment).
     """
     clauses_sets = [set(clause) for clause in clauses]
     assignment = {}
-    result = dpll(clauses_sets, assignment)
+    num_vars = max((abs(lit) for clause in clauses_sets for lit in clause),
+                   default=0)
+    if num_vars:
+        lits, starts = flatten_clauses(clauses_sets)
+        values = array("b", bytes(num_vars + 1))
+        status = propagate(lits, starts, values)
+        if status == 0:
+            return False, {}
+        for var in range(1, num_vars + 1):
+            if values[var]:
+                assignment[var] = values[var] > 0
+        if status == 1:
+            return True, assignment
+        if dpll_core is not None:
+            # Drop satisfied clauses and falsified literals, then search in
+            # native code; the model comes back through the values buffer.
+            clauses_sets = simplify_clauses(clauses_sets, assignment)
+            lits, starts = flatten_clauses(clauses_sets)
+            result = dpll_core.solve(lits, starts, values)
+            if result:
+                for var in range(1, num_vars + 1):
+                    if values[var]:
+                        assignment[var] = values[var] > 0
+            return result, assignment
+        # Drop satisfied clauses and falsified literals before the search.
+        clauses_sets = simplify_clauses(clauses_sets, assignment)
+    result = dpll(clauses_sets, assignment, cancel=cancel)
     return result, assignment
 
+def dpll_cube_and_conquer(clauses, num_workers=None):
+    """
+    Cube-and-conquer parallelization of a single DPLL call:
+      - Splits the search space at the root by fixing the most frequently
+        occurring variable both ways, recursively to a depth of about
+        log2(num_workers), producing up to one cube per worker.
+      - Solves each cube's simplified sub-formula with dpll_wrapper in its
+        own worker process; the first satisfiable cube wins, and a formula
+        is unsatisfiable when every cube is refuted.
+    Useful for hard single instances where process_clause_set's set-level
+    parallelism leaves cores idle.  Returns (result, assignment) like
+    dpll_wrapper.
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    depth = max(1, (num_workers - 1).bit_length())
+
+    cubes = [({}, [set(clause) for clause in clauses])]
+    for _ in range(depth):
+        split = []
+        for fixed, cube_clauses in cubes:
+            if not cube_clauses:
+                return True, fixed  # this cube is already satisfied
+            if any(len(clause) == 0 for clause in cube_clauses):
+                continue  # this cube is already refuted
+            counts = defaultdict(int)
+            for clause in cube_clauses:
+                for lit in clause:
+                    counts[abs(lit)] += 1
+            var = max(counts, key=counts.get)
+            for value in (True, False):
+                branch = dict(fixed)
+                branch[var] = value
+                split.append((branch,
+                              simplify_clauses(cube_clauses, {var: value})))
+        if not split:
+            return False, {}  # every cube refuted while splitting
+        cubes = split
+
+    # No 'with' block: on the first satisfiable cube the pool is shut down
+    # without waiting, so slow sibling cubes cannot delay the answer.
+    executor = ProcessPoolExecutor(max_workers=num_workers)
+    try:
+        futures = {executor.submit(dpll_wrapper, cube_clauses): fixed
+                   for fixed, cube_clauses in cubes}
+        for future in as_completed(futures):
+            result, assignment = future.result()
+            if result:
+                assignment.update(futures[future])
+                return True, assignment
+        return False, {}
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
 
 # ---------------------------
 # PARALLEL PROCESSING OF CLAUSE SETS
 # ---------------------------
 def process_clause_set(clauses, set_index):
     """
-    Process a single set of clauses using Resolution, DP, and DPLL.
-    Returns a tuple (set_index, results_dict).
+    Process a single set of clauses by racing Resolution, DP, and DPLL as a
+    portfolio: the three run concurrently in threads sharing a cancellation
+    event, and as soon as one delivers a verdict the others are told to
+    stop.  The three algorithms differ wildly in which instances they solve
+    fast, so per-set latency becomes min(t1, t2, t3) instead of the sum.
+    Returns a tuple (set_index, results_dict); algorithms that were
+    cancelled are reported with a None result and the time they ran.
+    A pair of contradictory unit clauses (the generator injects one with
+    probability unsat_prob) settles the set as unsatisfiable up front,
+    without starting any algorithm.
     """
+    units = {clause[0] for clause in clauses if len(clause) == 1}
+    if any(-u in units for u in units):
+        return set_index, {alg_name: (False, 0.0)
+                           for alg_name in ("Resolution", "DP", "DPLL")}
+
+    cancel = threading.Event()
+
+    def timed_run(solve):
+        start = time.time()
+        try:
+            result = solve()
+        except SearchCancelled:
+            result = None
+        return result, time.time() - start
+
+    algorithms = {
+        "Resolution": lambda: resolution(clauses, cancel=cancel),
+        "DP": lambda: dp(clauses, cancel=cancel),
+        "DPLL": lambda: dpll_wrapper(clauses, cancel=cancel)[0],
+    }
     results = {}
-
-    start = time.time()
-    res_resolution = resolution(clauses)
-    results["Resolution"] = (res_resolution, time.time() - start)
-
-    start = time.time()
-    res_dp = dp(clauses)
-    results["DP"] = (res_dp, time.time() - start)
-
-    start = time.time()
-    res_dpll, assignment = dpll_wrapper(clauses)
-    results["DPLL"] = (res_dpll, time.time() - start)
+    with ThreadPoolExecutor(max_workers=len(algorithms)) as executor:
+        futures = {executor.submit(timed_run, solve): alg_name
+                   for alg_name, solve in algorithms.items()}
+        wait(futures, return_when=FIRST_COMPLETED)
+        cancel.set()
+        for future, alg_name in futures.items():
+            results[alg_name] = future.result()
 
     return set_index, results
 
+def process_clause_batch(batch):
+    """
+    Process a batch of (set_index, clauses) pairs in a single worker call.
+    For the tiny generated formulas, per-task fork and pickling overhead
+    dominates the actual solving, so many formulas are shipped per task.
+    Returns a list of (set_index, results_dict) tuples.
+    """
+    return [process_clause_set(clauses, idx) for idx, clauses in batch]
+
 
 # ---------------------------
 # MAIN FUNCTION USING PARALLEL PROCESSING
@@ -245,13 +704,20 @@ def main_parallel():
     clause_sets = list(parse_input_file_generator(input_filename))
     results = {}
 
-    # Use a process pool to process each clause set concurrently
+    # Use a process pool, submitting chunks of clause sets so that each
+    # worker call amortizes process startup and serialization; ~4 chunks
+    # per worker keeps the pool load-balanced when set difficulty varies.
+    num_workers = os.cpu_count() or 1
+    chunk_size = max(1, len(clause_sets) // (4 * num_workers))
+    indexed = list(enumerate(clause_sets))
+    batches = [indexed[i:i + chunk_size]
+               for i in range(0, len(indexed), chunk_size)]
     with ProcessPoolExecutor() as executor:
-        futures = {executor.submit(process_clause_set, clauses, idx): idx
-                   for idx, clauses in enumerate(clause_sets)}
+        futures = [executor.submit(process_clause_batch, batch)
+                   for batch in batches]
         for future in as_completed(futures):
-            set_index, result = future.result()
-            results[set_index] = result
+            for set_index, result in future.result():
+                results[set_index] = result
 
     # Sort results by index
     sorted_results = [results[i] for i in sorted(results.keys())]
@@ -6,7 +6,7 @@ num_clauses = 20     # Number of clauses in each formula.
 num_literals = 10    # Variables are in the range [1, num_literals].
 unsat_prob = 0.3     # Probability to inject a pair of contradictory clauses.
 
-def generate_formula(num_clauses, num_literals, unsat_prob):
+def generate_formula(num_clauses, num_literals, unsat_prob, rng=None):
     """
     Generates a single CNF formula (list of clauses).
 
@@ -14,18 +14,22 @@ def generate_formula(num_clauses, num_literals, unsat_prob):
       num_clauses: Total number of clauses for the formula.
       num_literals: Variables are chosen from 1 to num_literals.
       unsat_prob: With this probability, a pair of contradictory unit clauses is injected.
+      rng: Optional random.Random instance; a local instance avoids the
+           module-level lock and lets callers share one generator.
 
     Returns:
       A list of clauses, where each clause is a list of integers.
     """
+    if rng is None:
+        rng = random.Random()
     formula = []
-    
+
     # Decide whether to inject a contradictory pair.
-    inject_unsat = random.random() < unsat_prob
-    
+    inject_unsat = rng.random() < unsat_prob
+
     if inject_unsat and num_clauses >= 2:
         # Choose one literal randomly.
-        chosen_literal = random.choice(range(1, num_literals + 1))
+        chosen_literal = rng.randint(1, num_literals)
         # Inject contradictory unit clauses: one [l] and one [-l].
         formula.append([chosen_literal])
         formula.append([-chosen_literal])
@@ -35,17 +39,17 @@ def generate_formula(num_clauses, num_literals, unsat_prob):
 
     # Generate the remaining clauses.
     # Here each clause will have between 1 and min(3, num_literals) literals.
+    max_size = min(3, num_literals)
+    variables = range(1, num_literals + 1)
     for _ in range(clauses_remaining):
-        clause_size = random.randint(1, min(3, num_literals))
-        # Randomly select distinct variables.
-        vars_chosen = random.sample(range(1, num_literals + 1), clause_size)
-        clause = []
-        for v in vars_chosen:
-            # Randomly decide the sign of the literal.
-            literal = v if random.choice([True, False]) else -v
-            clause.append(literal)
-        formula.append(clause)
-    
+        clause_size = rng.randint(1, max_size)
+        # Randomly select distinct variables, then draw all the signs in
+        # one getrandbits batch instead of one list-allocating choice each.
+        vars_chosen = rng.sample(variables, clause_size)
+        signs = rng.getrandbits(clause_size)
+        formula.append([v if (signs >> i) & 1 else -v
+                        for i, v in enumerate(vars_chosen)])
+
     return formula
 
 def write_input_file(filename, formulas):
@@ -61,8 +65,9 @@ def write_input_file(filename, formulas):
             f.write("\n")  # empty line separating formulas
 
 if __name__ == "__main__":
-    # Generate the formulas.
-    formulas = [generate_formula(num_clauses, num_literals, unsat_prob)
+    # Generate the formulas, sharing one local generator across them.
+    rng = random.Random()
+    formulas = [generate_formula(num_clauses, num_literals, unsat_prob, rng)
                 for _ in range(num_formulas)]
     
     # Write the formulas to the file.
@@ -0,0 +1,214 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Compiled watched-literal DPLL core.
+
+Operates on the same flat (lits, starts) clause arrays produced by
+copilot3.flatten_clauses, with every hot structure held in plain C arrays:
+two watched positions per clause, intrusive singly-linked watcher lists per
+literal, and an explicit trail for chronological backtracking.  No Python
+objects are touched between decisions, so there is no interpreter dispatch
+or refcounting in the propagation loop.
+
+Build in place with:
+
+    cythonize -i dpll_core.pyx
+
+copilot3.dpll_wrapper picks the extension up automatically when it is
+importable and falls back to the pure-Python trail engine otherwise.
+"""
+from libc.stdlib cimport malloc, free
+
+cdef enum:
+    UNASSIGNED = 0
+    TRUE = 1
+    FALSE = -1
+
+
+cdef inline int lit_slot(int lit, int num_vars) noexcept nogil:
+    # Map literal v / -v onto 0..2*num_vars-1 for the watcher heads.
+    return lit - 1 if lit > 0 else num_vars - lit - 1
+
+
+cdef inline int lit_value(int lit, signed char *values) noexcept nogil:
+    cdef signed char val = values[lit if lit > 0 else -lit]
+    if val == UNASSIGNED:
+        return UNASSIGNED
+    if lit > 0:
+        return val
+    return -val
+
+
+def solve(lits_flat, starts, values_out=None):
+    """
+    Watched-literal DPLL over flat int32 clause arrays.
+    Returns True when the formula is satisfiable.  When 'values_out' is a
+    writable int8 buffer of at least num_vars+1 entries (e.g. an
+    array('b')), it receives the satisfying assignment as -1/0/1 per
+    variable.
+    """
+    cdef int num_clauses = len(starts) - 1
+    cdef int num_lits = len(lits_flat)
+    cdef int i, c, k, v, w, s, lit, var, num_vars
+
+    if num_clauses <= 0:
+        return True
+
+    cdef int *lits = <int *> malloc((num_lits if num_lits > 0 else 1) * sizeof(int))
+    cdef int *cstart = <int *> malloc((num_clauses + 1) * sizeof(int))
+    if lits == NULL or cstart == NULL:
+        free(lits)
+        free(cstart)
+        raise MemoryError
+    for i in range(num_lits):
+        lits[i] = lits_flat[i]
+    for i in range(num_clauses + 1):
+        cstart[i] = starts[i]
+
+    num_vars = 0
+    for i in range(num_lits):
+        var = lits[i] if lits[i] > 0 else -lits[i]
+        if var > num_vars:
+            num_vars = var
+
+    cdef signed char *values = <signed char *> malloc((num_vars + 1) * sizeof(signed char))
+    cdef signed char *is_decision = <signed char *> malloc((num_vars + 1) * sizeof(signed char))
+    cdef int *trail = <int *> malloc((num_vars + 1) * sizeof(int))
+    # Two watch slots per clause; watcher id 2*c+s is slot s of clause c.
+    cdef int *watch_pos = <int *> malloc(2 * num_clauses * sizeof(int))
+    cdef int *watch_next = <int *> malloc(2 * num_clauses * sizeof(int))
+    cdef int *watch_head = <int *> malloc(2 * (num_vars + 1) * sizeof(int))
+    if (values == NULL or is_decision == NULL or trail == NULL or
+            watch_pos == NULL or watch_next == NULL or watch_head == NULL):
+        free(lits); free(cstart); free(values); free(is_decision)
+        free(trail); free(watch_pos); free(watch_next); free(watch_head)
+        raise MemoryError
+
+    cdef int trail_len = 0   # literals assigned, in order
+    cdef int qhead = 0       # next trail position to propagate
+    cdef int conflict, slot, other_pos, other, found, prev, nxt, widx
+    cdef int result = -1     # -1 undecided, 0 unsat, 1 sat
+
+    try:
+        for v in range(num_vars + 1):
+            values[v] = UNASSIGNED
+        for i in range(2 * (num_vars + 1)):
+            watch_head[i] = -1
+
+        # Initial watches and unit/empty clause handling.
+        for c in range(num_clauses):
+            if cstart[c] == cstart[c + 1]:
+                return False  # empty clause in the input
+            watch_pos[2 * c] = cstart[c]
+            # A unit clause watches its single literal with both slots.
+            watch_pos[2 * c + 1] = cstart[c] + 1 if cstart[c] + 1 < cstart[c + 1] else cstart[c]
+            for s in range(2):
+                w = 2 * c + s
+                widx = lit_slot(lits[watch_pos[w]], num_vars)
+                watch_next[w] = watch_head[widx]
+                watch_head[widx] = w
+            if cstart[c] + 1 == cstart[c + 1]:
+                lit = lits[cstart[c]]
+                s = lit_value(lit, values)
+                if s == FALSE:
+                    return False  # contradictory unit clauses
+                if s == UNASSIGNED:
+                    var = lit if lit > 0 else -lit
+                    values[var] = TRUE if lit > 0 else FALSE
+                    is_decision[trail_len] = 0
+                    trail[trail_len] = lit
+                    trail_len += 1
+
+        while True:
+            # --- propagate everything on the trail ---
+            conflict = 0
+            while qhead < trail_len and not conflict:
+                lit = trail[qhead]
+                qhead += 1
+                # Clauses watching -lit just lost that literal.
+                widx = lit_slot(-lit, num_vars)
+                prev = -1
+                w = watch_head[widx]
+                while w != -1:
+                    nxt = watch_next[w]
+                    c = w >> 1
+                    s = w & 1
+                    other_pos = watch_pos[2 * c + (1 - s)]
+                    other = lits[other_pos]
+                    if lit_value(other, values) == TRUE:
+                        prev = w
+                        w = nxt
+                        continue
+                    found = -1
+                    for k in range(cstart[c], cstart[c + 1]):
+                        if k == other_pos or k == watch_pos[w]:
+                            continue
+                        if lit_value(lits[k], values) != FALSE:
+                            found = k
+                            break
+                    if found != -1:
+                        # Relocate this watch onto the replacement literal.
+                        watch_pos[w] = found
+                        if prev == -1:
+                            watch_head[widx] = nxt
+                        else:
+                            watch_next[prev] = nxt
+                        k = lit_slot(lits[found], num_vars)
+                        watch_next[w] = watch_head[k]
+                        watch_head[k] = w
+                        w = nxt
+                        continue
+                    if lit_value(other, values) == FALSE:
+                        conflict = 1
+                        break
+                    # Unit: force the other watched literal.
+                    var = other if other > 0 else -other
+                    values[var] = TRUE if other > 0 else FALSE
+                    is_decision[trail_len] = 0
+                    trail[trail_len] = other
+                    trail_len += 1
+                    prev = w
+                    w = nxt
+
+            if conflict:
+                # --- chronological backtracking: flip the last decision ---
+                while trail_len > 0 and not is_decision[trail_len - 1]:
+                    trail_len -= 1
+                    lit = trail[trail_len]
+                    values[lit if lit > 0 else -lit] = UNASSIGNED
+                if trail_len == 0:
+                    result = 0
+                    break
+                trail_len -= 1
+                lit = trail[trail_len]
+                values[lit if lit > 0 else -lit] = UNASSIGNED
+                qhead = trail_len
+                # The flip is forced now, not a decision to revisit.
+                lit = -lit
+                var = lit if lit > 0 else -lit
+                values[var] = TRUE if lit > 0 else FALSE
+                is_decision[trail_len] = 0
+                trail[trail_len] = lit
+                trail_len += 1
+                continue
+
+            # --- decide the next unassigned variable ---
+            var = 0
+            for v in range(1, num_vars + 1):
+                if values[v] == UNASSIGNED:
+                    var = v
+                    break
+            if var == 0:
+                result = 1  # every variable assigned, no conflict
+                break
+            values[var] = TRUE
+            is_decision[trail_len] = 1
+            trail[trail_len] = var
+            trail_len += 1
+
+        if result == 1 and values_out is not None:
+            for v in range(1, num_vars + 1):
+                values_out[v] = values[v]
+        return result == 1
+    finally:
+        free(lits); free(cstart); free(values); free(is_decision)
+        free(trail); free(watch_pos); free(watch_next); free(watch_head)